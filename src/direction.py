@@ -16,6 +16,12 @@ class Direction(Enum):
     EAST : str = "E"
     SOUTH : str = "S"
     WEST : str = "W"
+
+    Attributes
+    ----------
+    index : int
+        The integer representation of the member, equal to `int(member)`.
+        Reading it directly skips the `__int__` call in hot loops.
     """
 
     NORTH = "N"
@@ -31,9 +37,7 @@ class Direction(Enum):
         `Direction`
             The `Direction` 90 degrees clockwise.
         """
-        order: list = [Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST]
-        index: int = order.index(Direction(self.value))
-        return Direction(order[(index + 1) % 4])
+        return _RIGHT_OF[self.index]
 
     def turn_left(self) -> Direction:
         """Return the `Direction` 90 degrees anti-clockwise.
@@ -43,9 +47,7 @@ class Direction(Enum):
         `Direction`
             The `Direction` 90 degrees anti-clockwise.
         """
-        order: list = [Direction.NORTH, Direction.WEST, Direction.SOUTH, Direction.EAST]
-        index: int = order.index(Direction(self.value))
-        return Direction(order[(index + 1) % 4])
+        return _LEFT_OF[self.index]
 
     def __int__(self) -> int:
         """Return the integer representation of the `Direction`
@@ -61,15 +63,7 @@ class Direction(Enum):
         int
             The integer representation of the `Direction`.
         """
-        match self:
-            case Direction.NORTH:
-                return 0
-            case Direction.EAST:
-                return 1
-            case Direction.SOUTH:
-                return 2
-            case Direction.WEST:
-                return 3
+        return self.index
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Direction):
@@ -77,3 +71,66 @@ class Direction(Enum):
         if isinstance(other, str):
             return self.value == other
         raise NotImplementedError
+
+    def __hash__(self) -> int:
+        # Defining __eq__ removes the inherited __hash__, which would leave members unusable in sets and as dict keys.
+        # Hash by value so that a member and its equal string hash the same.
+        return hash(self.value)
+
+
+# Integer representations, cached on each member as `index`.
+for _index, _direction in enumerate(
+    (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST)
+):
+    _direction.index = _index
+del _direction, _index
+
+# Rotation results indexed by the integer of the starting `Direction`.
+_RIGHT_OF: tuple[Direction, ...] = (
+    Direction.EAST,
+    Direction.SOUTH,
+    Direction.WEST,
+    Direction.NORTH,
+)
+_LEFT_OF: tuple[Direction, ...] = (
+    Direction.WEST,
+    Direction.NORTH,
+    Direction.EAST,
+    Direction.SOUTH,
+)
+
+
+def turn_right_int(direction: int) -> int:
+    """Return the integer heading 90 degrees clockwise of an integer heading.
+
+    Integer headings follow `int(Direction)`, so callers that carry the heading as an int can rotate it without creating `Direction` members.
+
+    Parameters
+    ----------
+    direction : int
+        The integer representation of a `Direction`.
+
+    Returns
+    -------
+    int
+        The integer representation of the `Direction` 90 degrees clockwise.
+    """
+    return (direction + 1) & 3
+
+
+def turn_left_int(direction: int) -> int:
+    """Return the integer heading 90 degrees anti-clockwise of an integer heading.
+
+    Integer headings follow `int(Direction)`, so callers that carry the heading as an int can rotate it without creating `Direction` members.
+
+    Parameters
+    ----------
+    direction : int
+        The integer representation of a `Direction`.
+
+    Returns
+    -------
+    int
+        The integer representation of the `Direction` 90 degrees anti-clockwise.
+    """
+    return (direction - 1) & 3
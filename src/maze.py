@@ -40,18 +40,20 @@ def create_maze(width: int = 5, height: int = 5) -> list[list[list[bool]]]:
         [[False, False, False, False] for _ in range(height)] for _ in range(width)
     ]
 
-    # Generating external walls
-    for i in range(width):
-        for j in range(height):
-            # Co-ordinate is (i, j).
-            if i == 0:
-                generated_maze[i][j][int(Direction.WEST)] = True  # Set west wall
-            if i == width - 1:
-                generated_maze[i][j][int(Direction.EAST)] = True  # Set east wall
-            if j == 0:
-                generated_maze[i][j][int(Direction.SOUTH)] = True  # Set south wall
-            if j == height - 1:
-                generated_maze[i][j][int(Direction.NORTH)] = True  # Set north wall
+    # Wall indices are loop-invariant, so look them up once.
+    north = Direction.NORTH.index
+    east = Direction.EAST.index
+    south = Direction.SOUTH.index
+    west = Direction.WEST.index
+
+    # Generating external walls, visiting only the cells along each edge.
+    for cell in generated_maze[0]:
+        cell[west] = True  # Set west wall
+    for cell in generated_maze[-1]:
+        cell[east] = True  # Set east wall
+    for column in generated_maze:
+        column[0][south] = True  # Set south wall
+        column[-1][north] = True  # Set north wall
 
     return generated_maze
 
@@ -92,7 +94,7 @@ def add_horizontal_wall(
             f"horizontal_line must be greater than or equal to 0, got {horizontal_line}"
         )
 
-    width, height = get_dimensions(maze)
+    width, height = _get_dimensions_unchecked(maze)
 
     if x_coordinate >= width:
         raise ValueError(
@@ -106,9 +108,9 @@ def add_horizontal_wall(
         )
 
     # Horizontal wall affects adjacent cells at indices [horizontal_line] and [horizontal_line - 1].
-    maze[x_coordinate][horizontal_line][int(Direction.SOUTH)] = True  # Set south wall
+    maze[x_coordinate][horizontal_line][Direction.SOUTH.index] = True  # Set south wall
     maze[x_coordinate][horizontal_line - 1][
-        int(Direction.NORTH)
+        Direction.NORTH.index
     ] = True  # Set north wall
 
     return maze
@@ -150,7 +152,7 @@ def add_vertical_wall(
             f"vertical_line must be greater than or equal to 0, got {vertical_line}"
         )
 
-    width, height = get_dimensions(maze)
+    width, height = _get_dimensions_unchecked(maze)
 
     if y_coordinate >= height:
         raise ValueError(
@@ -164,8 +166,81 @@ def add_vertical_wall(
         )
 
     # Vertical wall affects adjacent cells at indices [vertical_line] and [vertical_line - 1].
-    maze[vertical_line][y_coordinate][int(Direction.WEST)] = True  # Set west wall
-    maze[vertical_line - 1][y_coordinate][int(Direction.EAST)] = True  # Set east wall
+    maze[vertical_line][y_coordinate][Direction.WEST.index] = True  # Set west wall
+    maze[vertical_line - 1][y_coordinate][Direction.EAST.index] = True  # Set east wall
+
+    return maze
+
+
+def add_walls(
+    maze: list[list[list[bool]]],
+    horizontal_walls: list[tuple[int, int]] | None = None,
+    vertical_walls: list[tuple[int, int]] | None = None,
+) -> list[list[list[bool]]]:
+    """Return the maze with a batch of horizontal and vertical walls added.
+
+    This is equivalent to calling `add_horizontal_wall` and `add_vertical_wall` for each wall,
+    but the dimensions and wall indices are looked up once for the whole batch.
+    Every wall is validated before any is added, so an invalid wall leaves the maze unchanged.
+
+    Parameters
+    ----------
+    maze : list[list[list[bool]]]
+        The maze to add walls to.
+    horizontal_walls : list[tuple[int, int]], optional
+        The horizontal walls to add, as (x_coordinate, horizontal_line) pairs. Default is None.
+    vertical_walls : list[tuple[int, int]], optional
+        The vertical walls to add, as (y_coordinate, vertical_line) pairs. Default is None.
+
+    Returns
+    -------
+    list[list[list[bool]]]
+        The maze with the walls added.
+    """
+    horizontal_walls = [] if horizontal_walls is None else list(horizontal_walls)
+    vertical_walls = [] if vertical_walls is None else list(vertical_walls)
+
+    width, height = _get_dimensions_unchecked(maze)
+
+    for x_coordinate, horizontal_line in horizontal_walls:
+        if not (isinstance(x_coordinate, int) and isinstance(horizontal_line, int)):
+            raise TypeError(
+                f"horizontal wall must be (int, int), got ({type(x_coordinate).__name__}, {type(horizontal_line).__name__})"
+            )
+        if not 0 <= x_coordinate < width:
+            raise ValueError(
+                f"x_coordinate must be between 0 and {width - 1}, got {x_coordinate}"
+            )
+        if not 0 < horizontal_line < height:
+            raise ValueError(
+                f"horizontal_line must be between 1 and {height - 1}, got {horizontal_line}"
+            )
+    for y_coordinate, vertical_line in vertical_walls:
+        if not (isinstance(y_coordinate, int) and isinstance(vertical_line, int)):
+            raise TypeError(
+                f"vertical wall must be (int, int), got ({type(y_coordinate).__name__}, {type(vertical_line).__name__})"
+            )
+        if not 0 <= y_coordinate < height:
+            raise ValueError(
+                f"y_coordinate must be between 0 and {height - 1}, got {y_coordinate}"
+            )
+        if not 0 < vertical_line < width:
+            raise ValueError(
+                f"vertical_line must be between 1 and {width - 1}, got {vertical_line}"
+            )
+
+    north = Direction.NORTH.index
+    east = Direction.EAST.index
+    south = Direction.SOUTH.index
+    west = Direction.WEST.index
+
+    for x_coordinate, horizontal_line in horizontal_walls:
+        column = maze[x_coordinate]
+        column[horizontal_line][south] = True  # Set south wall
+        column[horizontal_line - 1][north] = True  # Set north wall
+    for y_coordinate, vertical_line in vertical_walls:
+        maze[vertical_line][y_coordinate][west] = True  # Set west wall
+        maze[vertical_line - 1][y_coordinate][east] = True  # Set east wall
 
     return maze
 
@@ -184,11 +259,7 @@ def get_dimensions(maze: list[list[list[bool]]]) -> tuple[int, int]:
         The dimensions of the maze.
         Returned as (width, height).
     """
-    if not (isinstance(maze, list) and isinstance(maze[0], list)):
-        raise TypeError(f"maze must be list[list]!")
-
-    width = len(maze)
-    height = len(maze[0])
+    width, height = _get_dimensions_unchecked(maze)
 
     # Ensure maze is not jagged
     for column in maze:
@@ -198,6 +269,29 @@ def get_dimensions(maze: list[list[list[bool]]]) -> tuple[int, int]:
     return width, height
 
 
+def _get_dimensions_unchecked(maze: list[list[list[bool]]]) -> tuple[int, int]:
+    """Return the dimensions of the maze without checking that it is not jagged.
+
+    This is an internal helper method - not intended to be called externally.
+    Mazes built by `create_maze` are always rectangular, so the wall helpers use this to avoid scanning every column.
+
+    Parameters
+    ----------
+    maze : list[list[list[bool]]]
+        The maze to get dimensions from.
+
+    Returns
+    -------
+    tuple[int, int]
+        The dimensions of the maze.
+        Returned as (width, height).
+    """
+    if not (isinstance(maze, list) and isinstance(maze[0], list)):
+        raise TypeError(f"maze must be list[list]!")
+
+    return len(maze), len(maze[0])
+
+
 def get_walls(
     maze: list[list[list[bool]]], x_coordinate: int, y_coordinate: int
 ) -> tuple[bool, bool, bool, bool]:
@@ -234,7 +328,7 @@ def get_walls(
             f"y_coordinate must be greater than or equal to 0, got {y_coordinate}"
         )
 
-    width, height = get_dimensions(maze)
+    width, height = _get_dimensions_unchecked(maze)
 
     if x_coordinate >= width:
         raise ValueError(
@@ -250,4 +344,54 @@ def get_walls(
     if not (isinstance(cell, list) and all(isinstance(wall, bool) for wall in cell)):
         raise TypeError(f"maze cell must be list[bool]!")
 
-    return cell[0], cell[1], cell[2], cell[3]
+    return tuple(cell)
+
+
+def _get_walls_unchecked(
+    maze: list[list[list[bool]]], x_coordinate: int, y_coordinate: int
+) -> list[bool]:
+    """Return the cell at a given position in the maze without validating the arguments or copying the cell.
+
+    This is an internal helper method - not intended to be called externally.
+    The caller must ensure the position is inside the maze, e.g. when stepping a runner that started inside it,
+    and must not modify the returned cell.
+
+    Parameters
+    ----------
+    maze : list[list[list[bool]]]
+        The maze to search for cells.
+    x_coordinate : int
+        The x coordinate of the cell.
+    y_coordinate : int
+        The y coordinate of the cell.
+
+    Returns
+    -------
+    list[bool]
+        The cell at a given position in the maze.
+    """
+    return maze[x_coordinate][y_coordinate]
+
+
+def _check_closed_boundary(maze: list[list[list[bool]]]) -> None:
+    """Raise a ValueError if any cell on the edge of the maze has no wall on its outer side.
+
+    This is an internal helper method - not intended to be called externally.
+    Searches that read cells without bounds checks call this once first, so they can never step off the maze.
+
+    Parameters
+    ----------
+    maze : list[list[list[bool]]]
+        The maze to check.
+    """
+    north = Direction.NORTH.index
+    east = Direction.EAST.index
+    south = Direction.SOUTH.index
+    west = Direction.WEST.index
+
+    if not (
+        all(cell[west] for cell in maze[0])
+        and all(cell[east] for cell in maze[-1])
+        and all(column[0][south] and column[-1][north] for column in maze)
+    ):
+        raise ValueError("maze must be enclosed by walls on every edge")
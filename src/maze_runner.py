@@ -3,74 +3,71 @@
 
 """Module defining behaviour related to both the maze and the runner combined."""
 
+import heapq
 from runner import *
 from maze import *
+from maze import _check_closed_boundary
+
+# Movement direction for each (dx, dy) step between adjacent positions.
+_DIRECTION_FROM_DELTA: dict[tuple[int, int], Direction] = {
+    (0, 1): Direction.NORTH,
+    (1, 0): Direction.EAST,
+    (0, -1): Direction.SOUTH,
+    (-1, 0): Direction.WEST,
+}
+
+# Sequence of actions for each previous and movement direction, indexed by `Direction.index`.
+_SEQUENCES: tuple[tuple[str, str, str, str], ...] = (
+    # Movement: NORTH, EAST, SOUTH, WEST
+    ("F", "RF", "B", "LF"),  # Previously facing NORTH
+    ("LF", "F", "RF", "B"),  # Previously facing EAST
+    ("B", "LF", "F", "RF"),  # Previously facing SOUTH
+    ("RF", "B", "LF", "F"),  # Previously facing WEST
+)
+
+
+def _optimise_path(
+    path: list[tuple[int, int, str]], width: int, height: int
+) -> list[tuple[int, int]]:
+    """Remove loops from the exploration path and return a path that visits each position once.
 
-
-def link_list(list_to_link: list) -> list[list]:
-    """Return a linked list from a supplied list.
+    This is an internal helper method - not intended to be called externally.
 
     Parameters
     ----------
-    list_to_link: list[list]
-        The list to link.
+    path: list[tuple[int, int, str]]
+        The exploration path to remove loops from.
+    width: int
+        The width of the maze explored.
+    height: int
+        The height of the maze explored.
 
     Returns
     -------
-    list[list]
-        The newly linked list.
+    list[tuple[int, int]]
+        The positions of the new path without loops.
     """
-    linked_list = [[item, index + 1] for index, item in enumerate(list_to_link)]
-    linked_list[-1][1] = -1  # Set last link to -1 to indicate end of linked list
-    return linked_list
+    # Record the last step at which each position is visited, in a flat list indexed by x * height + y
+    last_seen: list[int] = [0] * (width * height)
+    for index, (pos_x, pos_y, _) in enumerate(path):
+        last_seen[pos_x * height + pos_y] = index
 
+    optimised_path: list[tuple[int, int]] = []
+    append = optimised_path.append  # Bound once rather than looked up every step
 
-def _optimise_path(linked_path: list[list]) -> list[tuple[int, int, str]]:
-    """Remove duplicate positions from the linked path and return a normal path.
-
-    This is an internal helper method - not intended to be called externally.
-
-    Parameters
-    ----------
-    linked_path: list[list]
-        The linked path to remove duplicate positions from.
-
-    Returns
-    -------
-    list[tuple[int, int, str]]
-        The new, non-linked path. The string part of the tuple will be empty, to be filled in later.
-    """
-    # Remove unnecessary positions from linked path by reassigning pointers
-    seen_positions: dict[tuple[int, int], int] = {}
-    for index, ((pos_x, pos_y, _), next_index) in enumerate(linked_path):
-        # End of journey, skip iteration
-        if next_index == -1:
-            continue
+    # From each position, skip to the step after its final visit, cutting out any loop in between
+    index = 0
+    while index < len(path):
+        pos_x, pos_y, _ = path[index]
+        append((pos_x, pos_y))
 
-        if (pos_x, pos_y) in seen_positions:
-            index_of_previously_seen = seen_positions[(pos_x, pos_y)]
-            # Skip all the unnecessary positions in between
-            linked_path[index_of_previously_seen][1] = next_index
-            # Update seen_positions
-            seen_positions[(pos_x, pos_y)] = index
-        else:
-            seen_positions[(pos_x, pos_y)] = index
-
-    optimised_path: list[tuple[int, int, str]] = []
-    # Iterate through linked path, using the links to get the optimised path
-    next_index = 0
-    while next_index != -1:
-        pos_x = linked_path[next_index][0][0]
-        pos_y = linked_path[next_index][0][1]
-        optimised_path.append((pos_x, pos_y, ""))
-
-        next_index = linked_path[next_index][1]
+        index = last_seen[pos_x * height + pos_y] + 1
 
     return optimised_path
 
 
 def _construct_sequences(
-    optimised_path: list[tuple[int, int, str]], starting_direction: Direction
+    optimised_path: list[tuple[int, int]], starting_direction: Direction
 ) -> list[tuple[int, int, str]]:
     """Add sequences to the optimised path, as well as removing the last (goal) position.
 
@@ -78,8 +75,8 @@ def _construct_sequences(
 
     Parameters
     ----------
-    optimised_path: list[tuple[int, int, str]]
-        The optimised path to add sequences to.
+    optimised_path: list[tuple[int, int]]
+        The positions of the optimised path to add sequences to.
     starting_direction: Direction
         The `Direction` the runner started out facing.
 
@@ -88,46 +85,44 @@ def _construct_sequences(
     list[tuple[int, int, str]]
         The optimised path with sequences added. The last item is also removed.
     """
+    # Preallocated output, so the input is not rebuilt in place or sliced at the end
+    path_with_sequences: list[tuple[int, int, str]] = [None] * (len(optimised_path) - 1)
+
+    # Alias the module-level tables to locals for faster lookups inside the loop
+    direction_from_delta = _DIRECTION_FROM_DELTA
+    sequences = _SEQUENCES
+
     prev_direction = starting_direction
-    for index, (pos_x, pos_y, sequence) in enumerate(optimised_path[:-1]):
-        next_index = index + 1
-        next_pos_x = optimised_path[next_index][0]
-        next_pos_y = optimised_path[next_index][1]
-        left_direction = prev_direction.turn_left()
-        right_direction = prev_direction.turn_right()
-
-        movement_direction = None
-        if next_pos_x > pos_x:
-            movement_direction = Direction.EAST
-        elif next_pos_x < pos_x:
-            movement_direction = Direction.WEST
-        elif next_pos_y > pos_y:
-            movement_direction = Direction.NORTH
-        elif next_pos_y < pos_y:
-            movement_direction = Direction.SOUTH
-
-        if movement_direction == prev_direction:
-            optimised_path[index] = (pos_x, pos_y, "F")
-        elif movement_direction == left_direction:
-            optimised_path[index] = (pos_x, pos_y, "LF")
-        elif movement_direction == right_direction:
-            optimised_path[index] = (pos_x, pos_y, "RF")
-        else:
-            optimised_path[index] = (pos_x, pos_y, "B")
+    for index in range(len(optimised_path) - 1):
+        pos_x, pos_y = optimised_path[index]
+        next_pos_x, next_pos_y = optimised_path[index + 1]
+        movement_direction = direction_from_delta[
+            (next_pos_x - pos_x, next_pos_y - pos_y)
+        ]
+
+        path_with_sequences[index] = (
+            pos_x,
+            pos_y,
+            sequences[prev_direction.index][movement_direction.index],
+        )
 
         prev_direction = movement_direction
 
-    return optimised_path[:-1]
+    return path_with_sequences
 
 
 def write_exploration_path_to_file(
     path: list[tuple[int, int, str]], exploration_file: str
 ) -> None:
     """Write the exploration path to a file."""
+    # Build the whole file in memory so it is written with a single call
+    lines = ["Step,x-coordinate,y-coordinate,Actions\n"]
+    lines.extend(
+        f"{index+1},{pos_x},{pos_y},{path[index+1][2]}\n"
+        for index, (pos_x, pos_y, sequence) in enumerate(path[:-1])
+    )
     with open(exploration_file, "w") as file:
-        file.write("Step,x-coordinate,y-coordinate,Actions\n")
-        for index, (pos_x, pos_y, sequence) in enumerate(path[:-1]):
-            file.write(f"{index+1},{pos_x},{pos_y},{path[index+1][2]}\n")
+        file.write("".join(lines))
 
 
 def write_statistics_to_file(
@@ -155,9 +150,11 @@ def shortest_path(
     scribe: bool = False,
     maze_file_name: str | None = None,
 ) -> list[tuple[int, int, str]]:
-    """Return the shortest sequence from the starting position to the goal position found by a maze runner.
+    """Return the shortest sequence from the starting position to the goal position.
 
-    The path found may not necessarily be the shortest possible, as that is determined by the exploration algorithm.
+    When scribing, the sequence is the one found by a maze runner exploring the maze, so that the exploration can be recorded.
+    That path may not necessarily be the shortest possible, as that is determined by the exploration algorithm.
+    Otherwise, the path is planned directly with `astar` and is always a shortest path.
 
     Parameters
     ----------
@@ -175,32 +172,138 @@ def shortest_path(
     Returns
     -------
     list[tuple[int, int, str]]
-        The shortest sequence from the starting position to the goal position found by a maze runner.
+        The sequence from the starting position to the goal position, planned with `astar`,
+        or found by a maze runner when scribing.
     """
     if not isinstance(scribe, bool):
         raise TypeError(f"scribe must be bool, got {type(scribe).__name__}")
 
+    if not scribe:
+        return _construct_sequences(astar(maze, starting, goal), Direction.NORTH)
+
     starting_x, starting_y = get_position_or_default(
         maze, starting, (Direction.WEST, Direction.SOUTH)
     )
     runner = create_runner(starting_x, starting_y)
     path = explore(runner, maze, goal)
 
-    linked_path = link_list(path)
-    optimised_path = _optimise_path(linked_path)
+    optimised_path = _optimise_path(path, *get_dimensions(maze))
     optimised_path_with_sequences = _construct_sequences(
         optimised_path, Direction.NORTH
     )
 
-    if scribe:
-        write_exploration_path_to_file(path, "exploration.csv")
-        write_statistics_to_file(
-            maze_file_name, path, optimised_path_with_sequences, "statistics.txt"
-        )
+    write_exploration_path_to_file(path, "exploration.csv")
+    write_statistics_to_file(
+        maze_file_name, path, optimised_path_with_sequences, "statistics.txt"
+    )
 
     return optimised_path_with_sequences
 
 
+def astar(
+    maze: list[list[list[bool]]],
+    starting: tuple[int, int] | None = None,
+    goal: tuple[int, int] | None = None,
+) -> list[tuple[int, int]]:
+    """Return the positions along a shortest path from the starting position to the goal position, found with A* search.
+
+    The Manhattan distance to the goal is used as the heuristic. It never overestimates the number of steps left,
+    so the first time the goal is taken from the open set, the path to it is a shortest path.
+    If the goal cannot be reached, a ValueError is raised.
+    The maze must be enclosed by walls on every edge, otherwise a ValueError is raised.
+
+    Parameters
+    ----------
+    maze: list[list[list[bool]]]
+        The maze to search.
+    starting: tuple[int, int], optional
+        The starting position. If None, the starting position will be the bottom left of the maze. Default is None.
+    goal : tuple[int, int], optional
+        The position of the goal. If None, the goal will be the top right of the maze. Default is None.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The positions along the path, from the starting position to the goal position inclusive.
+    """
+    starting_x, starting_y = get_position_or_default(
+        maze, starting, (Direction.WEST, Direction.SOUTH)
+    )
+    goal_x, goal_y = get_position_or_default(
+        maze, goal, (Direction.EAST, Direction.NORTH)
+    )
+    starting_position = (starting_x, starting_y)
+    goal_position = (goal_x, goal_y)
+
+    # Neighbours are not bounds checked, so an open edge would lead off the maze
+    _check_closed_boundary(maze)
+
+    # Open set as a heap of (estimated total cost, cost so far, position)
+    open_heap = [
+        (abs(goal_x - starting_x) + abs(goal_y - starting_y), 0, starting_position)
+    ]
+    cost_so_far: dict[tuple[int, int], int] = {starting_position: 0}
+    came_from: dict[tuple[int, int], tuple[int, int] | None] = {starting_position: None}
+    closed: set[tuple[int, int]] = set()
+
+    while open_heap:
+        _, cost, position = heapq.heappop(open_heap)
+        if position == goal_position:
+            break
+        if position in closed:
+            continue
+        closed.add(position)
+
+        pos_x, pos_y = position
+        cell = maze[pos_x][pos_y]
+        for (delta_x, delta_y), direction in _DIRECTION_FROM_DELTA.items():
+            if cell[direction.index]:  # Wall in the way
+                continue
+
+            neighbour = (pos_x + delta_x, pos_y + delta_y)
+            neighbour_cost = cost + 1
+            if neighbour_cost < cost_so_far.get(neighbour, neighbour_cost + 1):
+                cost_so_far[neighbour] = neighbour_cost
+                came_from[neighbour] = position
+                heuristic = abs(goal_x - neighbour[0]) + abs(goal_y - neighbour[1])
+                heapq.heappush(
+                    open_heap, (neighbour_cost + heuristic, neighbour_cost, neighbour)
+                )
+    else:
+        raise ValueError(
+            f"goal {goal_position} cannot be reached from {starting_position}"
+        )
+
+    # Follow the links back from the goal to rebuild the path
+    path: list[tuple[int, int]] = []
+    position = goal_position
+    while position is not None:
+        path.append(position)
+        position = came_from[position]
+    path.reverse()
+
+    return path
+
+
+def _read_maze_file_lines(maze_file: str) -> list[str]:
+    """Read a maze file once and return its lines with surrounding whitespace removed.
+
+    This is an internal helper method - not intended to be called externally.
+
+    Parameters
+    ----------
+    maze_file: str
+        The path to the maze file.
+
+    Returns
+    -------
+    list[str]
+        The stripped lines of the maze file.
+    """
+    with open(maze_file, "r") as file:
+        return [line.strip() for line in file.readlines()]
+
+
 def is_valid_maze_file(maze_file: str) -> bool:
     """Return `True` if `maze_file` is a valid maze file.
 
@@ -214,40 +317,52 @@ def is_valid_maze_file(maze_file: str) -> bool:
     bool
     `True` if `maze_file` is a valid maze file.
     """
-    with open(maze_file, "r") as file:
-        maze_file_lines = [line.strip() for line in file.readlines()]
+    return _is_valid_maze_file_lines(_read_maze_file_lines(maze_file))
+
+
+def _is_valid_maze_file_lines(maze_file_lines: list[str]) -> bool:
+    """Return `True` if the lines read from a maze file form a valid maze.
+
+    This is an internal helper method - not intended to be called externally.
 
-        # Ensure all lines are same length
-        length = len(maze_file_lines[0])
-        for line in maze_file_lines:
-            if len(line) != length:
-                return False
+    Parameters
+    ----------
+    maze_file_lines: list[str]
+        The stripped lines of the maze file.
 
-        # Ensure line length and line count are odd
-        if len(maze_file_lines) % 2 == 0:
+    Returns
+    -------
+    bool
+    `True` if the lines form a valid maze.
+    """
+    # Ensure all lines are same length
+    length = len(maze_file_lines[0])
+    for line in maze_file_lines:
+        if len(line) != length:
             return False
-        if len(maze_file_lines[0]) % 2 == 0:
+
+    # Ensure line length and line count are odd
+    if len(maze_file_lines) % 2 == 0:
+        return False
+    if len(maze_file_lines[0]) % 2 == 0:
+        return False
+
+    # Ensure external walls present. Stripping the expected character leaves nothing if every character matches.
+    if maze_file_lines[0].strip("#") or maze_file_lines[-1].strip("#"):
+        return False
+    for line in maze_file_lines[1:-1]:
+        if line[0] != "#" or line[-1] != "#":
+            return False
+
+    # Ensure wall intersections are all hashes
+    for line in maze_file_lines[0::2]:
+        if line[0::2].strip("#"):
             return False
 
-        # Ensure external walls present
-        for char in maze_file_lines[0] + maze_file_lines[-1]:
-            if char != "#":
-                return False
-        for line in maze_file_lines[1:-1]:
-            if line[0] != "#" or line[-1] != "#":
-                return False
-
-        # Ensure wall intersections are all hashes
-        for line in maze_file_lines[0::2]:
-            for char in line[0::2]:
-                if char != "#":
-                    return False
-
-        # Ensure cell positions are all dots
-        for line in maze_file_lines[1::2]:
-            for char in line[1::2]:
-                if char != ".":
-                    return False
+    # Ensure cell positions are all dots
+    for line in maze_file_lines[1::2]:
+        if line[1::2].strip("."):
+            return False
 
     return True
 
@@ -265,13 +380,28 @@ def get_maze_file_dimensions(maze_file: str) -> tuple[int, int]:
     tuple[int, int]
         The dimensions of the maze file as (width, height).
     """
-    with open(maze_file, "r") as file:
-        maze_file_lines = [line.strip() for line in file.readlines()]
+    return _get_maze_file_lines_dimensions(_read_maze_file_lines(maze_file))
 
-        maze_width: int = (len(maze_file_lines[0]) - 1) // 2
-        maze_height: int = (len(maze_file_lines) - 1) // 2
 
-        return maze_width, maze_height
+def _get_maze_file_lines_dimensions(maze_file_lines: list[str]) -> tuple[int, int]:
+    """Return the dimensions of the maze described by the lines of a maze file as (width, height).
+
+    This is an internal helper method - not intended to be called externally.
+
+    Parameters
+    ----------
+    maze_file_lines: list[str]
+        The stripped lines of the maze file.
+
+    Returns
+    -------
+    tuple[int, int]
+        The dimensions of the maze as (width, height).
+    """
+    maze_width: int = (len(maze_file_lines[0]) - 1) // 2
+    maze_height: int = (len(maze_file_lines) - 1) // 2
+
+    return maze_width, maze_height
 
 
 def get_maze_file_cells(maze_file: str) -> list[list[tuple[str, str, str, str]]]:
@@ -290,34 +420,46 @@ def get_maze_file_cells(maze_file: str) -> list[list[tuple[str, str, str, str]]]
     list[list[tuple[str, str, str, str]]]
         The cells of the maze file.
     """
-    cells: list[list[tuple[str, str, str, str]]] = None
-    with open(maze_file, "r") as file:
-        maze_file_lines = [line.strip() for line in file.readlines()]
+    return _get_maze_file_lines_cells(_read_maze_file_lines(maze_file))
 
-        maze_width, maze_height = get_maze_file_dimensions(maze_file)
 
-        # cells indexed as cells[x][y]
-        cells = [
-            [("", "", "", "") for _ in range(maze_height)] for _ in range(maze_width)
-        ]
+def _get_maze_file_lines_cells(
+    maze_file_lines: list[str],
+) -> list[list[tuple[str, str, str, str]]]:
+    """Return the cells described by the lines of a maze file, where each cell is a tuple of 4 characters.
 
-        for line_index, line in enumerate(maze_file_lines):
-            for char_index, char in enumerate(line):
-                if line_index % 2 == 1 and char_index % 2 == 1:
-                    cell_x: int = (char_index - 1) // 2
-                    cell_y: int = (len(maze_file_lines) - line_index - 2) // 2
+    This is an internal helper method - not intended to be called externally.
 
-                    north_neighbour = maze_file_lines[line_index - 1][char_index]
-                    east_neighbour = maze_file_lines[line_index][char_index + 1]
-                    south_neighbour = maze_file_lines[line_index + 1][char_index]
-                    west_neighbour = maze_file_lines[line_index][char_index - 1]
+    Parameters
+    ----------
+    maze_file_lines: list[str]
+        The stripped lines of the maze file.
 
-                    cells[cell_x][cell_y] = (
-                        north_neighbour,
-                        east_neighbour,
-                        south_neighbour,
-                        west_neighbour,
-                    )
+    Returns
+    -------
+    list[list[tuple[str, str, str, str]]]
+        The cells of the maze file.
+    """
+    maze_width, maze_height = _get_maze_file_lines_dimensions(maze_file_lines)
+
+    # cells indexed as cells[x][y]
+    cells: list[list[tuple[str, str, str, str]]] = [
+        [("", "", "", "") for _ in range(maze_height)] for _ in range(maze_width)
+    ]
+
+    for line_index in range(1, len(maze_file_lines) - 1, 2):
+        line = maze_file_lines[line_index]
+        cell_y: int = (len(maze_file_lines) - line_index - 2) // 2
+
+        # Take the neighbours of every cell in the row as strided slices, in `Direction` order
+        row_cells = zip(
+            maze_file_lines[line_index - 1][1::2],  # North neighbours
+            line[2::2],  # East neighbours
+            maze_file_lines[line_index + 1][1::2],  # South neighbours
+            line[0:-1:2],  # West neighbours
+        )
+        for cell_x, cell in enumerate(row_cells):
+            cells[cell_x][cell_y] = cell
 
     return cells
 
@@ -337,13 +479,8 @@ def maze_file_cell_to_maze_cell(
     list[bool]
         The maze file cell converted to a regular maze cell.
     """
-    maze_cell = [False, False, False, False]
-    maze_cell[int(Direction.NORTH)] = maze_file_cell[int(Direction.NORTH)] == "#"
-    maze_cell[int(Direction.EAST)] = maze_file_cell[int(Direction.EAST)] == "#"
-    maze_cell[int(Direction.SOUTH)] = maze_file_cell[int(Direction.SOUTH)] == "#"
-    maze_cell[int(Direction.WEST)] = maze_file_cell[int(Direction.WEST)] == "#"
-
-    return maze_cell
+    # The neighbours are already in `Direction` order, so each one maps straight to a wall
+    return [neighbour == "#" for neighbour in maze_file_cell]
 
 
 def maze_reader(maze_file: str) -> list[list[list[bool]]]:
@@ -360,16 +497,25 @@ def maze_reader(maze_file: str) -> list[list[list[bool]]]:
         The maze created.
     """
     try:
-        if not is_valid_maze_file(maze_file):
-            raise ValueError("maze file must contain a valid maze.")
+        # Read the file once and share its lines between the helpers
+        maze_file_lines = _read_maze_file_lines(maze_file)
 
-        maze_file_cells = get_maze_file_cells(maze_file)
-        maze_width, maze_height = get_maze_file_dimensions(maze_file)
-        maze = create_maze(maze_width, maze_height)
+        if not _is_valid_maze_file_lines(maze_file_lines):
+            raise ValueError("maze file must contain a valid maze.")
 
-        for i in range(maze_width):
-            for j in range(maze_height):
-                maze[i][j] = maze_file_cell_to_maze_cell(maze_file_cells[i][j])
+        # The maze is built without create_maze, so repeat its check for an empty maze
+        maze_width, maze_height = _get_maze_file_lines_dimensions(maze_file_lines)
+        if maze_width <= 0:
+            raise ValueError(f"width must be greater than 0, got {maze_width}")
+        if maze_height <= 0:
+            raise ValueError(f"height must be greater than 0, got {maze_height}")
+
+        # Build the maze straight from the file cells instead of writing them over a blank maze
+        maze_file_cells = _get_maze_file_lines_cells(maze_file_lines)
+        maze = [
+            [maze_file_cell_to_maze_cell(cell) for cell in column]
+            for column in maze_file_cells
+        ]
 
         return maze
     except ValueError:
@@ -3,16 +3,44 @@
 
 """Module defining functions related to maze runners."""
 
-from direction import Direction
+from typing import NamedTuple
+from direction import Direction, turn_left_int, turn_right_int
 from turn import Turn
 from wall import Wall
 from maze import *
+from maze import _get_walls_unchecked, _check_closed_boundary
+
+# Change in (x, y) when moving one cell in each direction, indexed by `Direction.index`
+_DXDY = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Indices into the tuple returned by `sense_walls`
+_WALL_LEFT = int(Wall.LEFT)
+_WALL_FORWARD = int(Wall.FORWARD)
+_WALL_RIGHT = int(Wall.RIGHT)
+
+
+class Runner(NamedTuple):
+    """Record representing a maze runner.
+
+    Attributes
+    ----------
+    x : int
+        The X coordinate of the runner.
+    y : int
+        The Y coordinate of the runner.
+    orientation : `Direction`
+        The orientation of the runner.
+    """
+
+    x: int
+    y: int
+    orientation: Direction
 
 
 def create_runner(
     x: int = 0, y: int = 0, orientation: Direction | str = Direction.NORTH
-) -> dict:
-    """Return a dictionary object representing a maze runner.
+) -> Runner:
+    """Return a `Runner` representing a maze runner.
 
     Parameters
     ----------
@@ -25,8 +53,8 @@ def create_runner(
 
     Returns
     -------
-    dict
-        A dictionary object representing a maze runner.
+    `Runner`
+        A record representing a maze runner.
     """
     if not isinstance(x, int):
         raise TypeError(f"x must be int, got {type(x).__name__}")
@@ -44,94 +72,120 @@ def create_runner(
             f"orientation must be Direction enum member, got {type(orientation).__name__}"
         )
 
-    return {"x": x, "y": y, "orientation": orientation}
+    return Runner(x, y, orientation)
+
 
+def validate_runner(runner: Runner) -> None:
+    """Check that the runner and each of its fields have the expected types.
 
-def get_x(runner: dict) -> int:
+    The movement functions read the fields of the runner directly and do not validate it themselves,
+    so this should be called on runners that were not made by `create_runner`.
+
+    Parameters
+    ----------
+    runner : `Runner`
+        The maze runner.
+    """
+    if not isinstance(runner, Runner):
+        raise TypeError(f"runner must be Runner, got {type(runner).__name__}")
+    if not isinstance(runner.x, int):
+        raise TypeError(f"'x' must be int, got {type(runner.x).__name__}")
+    if not isinstance(runner.y, int):
+        raise TypeError(f"'y' must be int, got {type(runner.y).__name__}")
+    if not isinstance(runner.orientation, Direction):
+        raise TypeError(
+            f"'orientation' must be Direction enum member, got {type(runner.orientation).__name__}"
+        )
+
+
+def get_x(runner: Runner) -> int:
     """Return the X coordinate of the runner.
 
+    The type checks only run in debug mode, so they are skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
 
     Returns
     -------
     int
         The x coordinate of the runner.
     """
-    if not isinstance(runner, dict):
-        raise TypeError(f"runner must be dict, got {type(runner).__name__}")
-    if "x" not in runner:
-        raise KeyError(f"runner must contain the 'x' key")
-    if not isinstance(runner["x"], int):
-        raise TypeError(f"'x' must be int, got {type(runner['x']).__name__}")
+    if __debug__:
+        if not isinstance(runner, Runner):
+            raise TypeError(f"runner must be Runner, got {type(runner).__name__}")
+        if not isinstance(runner.x, int):
+            raise TypeError(f"'x' must be int, got {type(runner.x).__name__}")
 
-    return runner["x"]
+    return runner.x
 
 
-def get_y(runner: dict) -> int:
+def get_y(runner: Runner) -> int:
     """Return the Y coordinate of the runner.
 
+    The type checks only run in debug mode, so they are skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
 
     Returns
     -------
     int
         The y coordinate of the runner.
     """
-    if not isinstance(runner, dict):
-        raise TypeError(f"runner must be dict, got {type(runner).__name__}")
-    if "y" not in runner:
-        raise KeyError(f"runner must contain the 'y' key")
-    if not isinstance(runner["y"], int):
-        raise TypeError(f"'y' must be int, got {type(runner['y']).__name__}")
+    if __debug__:
+        if not isinstance(runner, Runner):
+            raise TypeError(f"runner must be Runner, got {type(runner).__name__}")
+        if not isinstance(runner.y, int):
+            raise TypeError(f"'y' must be int, got {type(runner.y).__name__}")
 
-    return runner["y"]
+    return runner.y
 
 
-def get_orientation(runner: dict) -> Direction:
+def get_orientation(runner: Runner) -> Direction:
     """Return the orientation of the runner.
 
+    The type checks only run in debug mode, so they are skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
 
     Returns
     -------
     `Direction`
         The orientation of the runner.
     """
-    if not isinstance(runner, dict):
-        raise TypeError(f"runner must be dict, got {type(runner).__name__}")
-    if "orientation" not in runner:
-        raise KeyError(f"runner must contain the 'orientation' key")
-    if not isinstance(runner["orientation"], Direction):
-        raise TypeError(
-            f"'orientation' must be Direction enum member, got {type(runner['orientation']).__name__}"
-        )
+    if __debug__:
+        if not isinstance(runner, Runner):
+            raise TypeError(f"runner must be Runner, got {type(runner).__name__}")
+        if not isinstance(runner.orientation, Direction):
+            raise TypeError(
+                f"'orientation' must be Direction enum member, got {type(runner.orientation).__name__}"
+            )
 
-    return runner["orientation"]
+    return runner.orientation
 
 
-def turn(runner: dict, direction: Turn | str) -> dict:
+def turn(runner: Runner, direction: Turn | str) -> Runner:
     """Turn the runner a given direction, then return the turned runner.
 
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     direction : Turn
         The direction to turn the runner. Must be a member of the `Turn` enum.
 
     Returns
     -------
-    dict
-        A dictionary object representing the turned runner.
+    `Runner`
+        The turned runner.
     """
     orientation = get_orientation(runner)
     if isinstance(direction, str):
@@ -146,74 +200,111 @@ def turn(runner: dict, direction: Turn | str) -> dict:
             f"direction must be Turn enum member, got {type(direction).__name__}"
         )
 
-    if direction == Turn.RIGHT:
-        return {**runner, "orientation": orientation.turn_right()}
-    else:  # direction can only == Turn.LEFT
-        return {**runner, "orientation": orientation.turn_left()}
+    if direction is Turn.RIGHT:
+        return runner._replace(orientation=orientation.turn_right())
+    else:  # direction can only be Turn.LEFT
+        return runner._replace(orientation=orientation.turn_left())
 
 
-def forward(runner: dict) -> dict:
+def forward(runner: Runner) -> Runner:
     """Move the runner forward one cell, then return the moved runner.
 
+    The runner is validated with `validate_runner` in debug mode only, so the check is skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
 
     Returns
     -------
-    dict
-        A dictionary object representing the moved runner.
+    `Runner`
+        The moved runner.
     """
-    x = get_x(runner)
-    y = get_y(runner)
-    orientation = get_orientation(runner)
+    if __debug__:
+        validate_runner(runner)
+
+    x, y, orientation = runner
+
+    return _step(x, y, orientation)
+
+
+def forward_many(runners: list[Runner]) -> list[Runner]:
+    """Move each runner forward one cell, then return the moved runners.
+
+    Equivalent to calling `forward` on each runner.
 
-    match orientation:
-        case Direction.NORTH:
-            y += 1
-        case Direction.EAST:
-            x += 1
-        case Direction.SOUTH:
-            y -= 1
-        case Direction.WEST:
-            x -= 1
+    Each runner is validated with `validate_runner` in debug mode only, so the checks are skipped under `python -O`.
 
-    return {**runner, "x": x, "y": y}
+    Parameters
+    ----------
+    runners : list[`Runner`]
+        The maze runners.
+
+    Returns
+    -------
+    list[`Runner`]
+        The moved runners, in the same order.
+    """
+    if __debug__:
+        for runner in runners:
+            validate_runner(runner)
 
+    return [_step(x, y, orientation) for x, y, orientation in runners]
 
-def backward(runner: dict) -> dict:
+
+def backward(runner: Runner) -> Runner:
     """Move the runner backward one cell, flipping direction, then return the moved runner.
 
+    The runner is validated with `validate_runner` in debug mode only, so the check is skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
 
     Returns
     -------
-    dict
-        A dictionary object representing the moved runner.
+    `Runner`
+        The moved runner.
     """
-    x = get_x(runner)
-    y = get_y(runner)
-    orientation = get_orientation(runner)
-    new_orientation = orientation.turn_left().turn_left()
+    if __debug__:
+        validate_runner(runner)
+
+    x, y, orientation = runner
+
+    # Stepping forward after turning around is the same as stepping backward
+    return _step(x, y, orientation.turn_left().turn_left())
+
 
-    match orientation:
-        case Direction.NORTH:
-            y -= 1
-        case Direction.EAST:
-            x -= 1
-        case Direction.SOUTH:
-            y += 1
-        case Direction.WEST:
-            x += 1
+def _step(x: int, y: int, orientation: Direction) -> Runner:
+    """Return a runner one cell on from (x, y) in the direction of the given orientation, facing that orientation.
 
-    return {**runner, "x": x, "y": y, "orientation": new_orientation}
+    This is an internal helper method - not intended to be called externally.
+    `forward`, `backward` and `move` all move the runner through this function.
 
+    Parameters
+    ----------
+    x : int
+        The X coordinate to step from.
+    y : int
+        The Y coordinate to step from.
+    orientation : `Direction`
+        The direction to step in, and the orientation of the returned runner.
+
+    Returns
+    -------
+    `Runner`
+        The moved runner.
+    """
+    dx, dy = _DXDY[orientation.index]
 
-def sense_walls(runner: dict, maze: list[list[list[bool]]]) -> tuple[bool, bool, bool]:
+    return Runner(x + dx, y + dy, orientation)
+
+
+def sense_walls(
+    runner: Runner, maze: list[list[list[bool]]]
+) -> tuple[bool, bool, bool]:
     """Return a tuple indicating whether there are walls to the left, straight ahead, or to the right of the runner.
 
     The returned tuple has the order: left, straight, right.
@@ -222,8 +313,8 @@ def sense_walls(runner: dict, maze: list[list[list[bool]]]) -> tuple[bool, bool,
 
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     maze : list[list[list[bool]]]
         The maze the runner is in.
 
@@ -232,42 +323,64 @@ def sense_walls(runner: dict, maze: list[list[list[bool]]]) -> tuple[bool, bool,
     tuple[bool, bool, bool]
         The tuple indicating whether there are walls to the left, straight ahead, or to the right of the runner.
     """
-    x = get_x(runner)
-    y = get_y(runner)
-    cell = get_walls(maze, x, y)
+    x, y, _ = runner
+    get_walls(maze, x, y)  # Validate the maze and position
 
-    # Get left and right of runner
-    orientation = get_orientation(runner)
-    left_direction = orientation.turn_left()
-    right_direction = orientation.turn_right()
+    return _sense_walls_unchecked(runner, maze)
 
-    return cell[int(left_direction)], cell[int(orientation)], cell[int(right_direction)]
 
+def _sense_walls_unchecked(
+    runner: Runner, maze: list[list[list[bool]]]
+) -> tuple[bool, bool, bool]:
+    """Return the walls to the left, straight ahead, and to the right of the runner without validating the position.
 
-def go_straight(runner: dict, maze: list[list[list[bool]]]) -> dict:
+    This is an internal helper method - not intended to be called externally.
+    The cell is read with `_get_walls_unchecked`, so it is indexed in place rather than copied into a tuple as `get_walls` does.
+
+    Parameters
+    ----------
+    runner : `Runner`
+        The maze runner.
+    maze : list[list[list[bool]]]
+        The maze the runner is in.
+
+    Returns
+    -------
+    tuple[bool, bool, bool]
+        The tuple indicating whether there are walls to the left, straight ahead, or to the right of the runner.
+    """
+    x, y, orientation = runner
+    cell = _get_walls_unchecked(maze, x, y)
+
+    # Get left and right of runner
+    index = orientation.index
+    return cell[turn_left_int(index)], cell[index], cell[turn_right_int(index)]
+
+
+def go_straight(runner: Runner, maze: list[list[list[bool]]]) -> Runner:
     """Advance the runner straight by one position, then return the moved runner.
 
     If the runner attempts to walk through a wall, a ValueError is raised.
 
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     maze : list[list[list[bool]]]
         The maze the runner is in.
 
     Returns
     -------
-    dict
-        A dictionary object representing the moved runner.
+    `Runner`
+        The moved runner.
     """
-    if not sense_walls(runner, maze)[1]:  # Wall directly ahead is empty
+    if not sense_walls(runner, maze)[_WALL_FORWARD]:  # Wall directly ahead is empty
         return forward(runner)
     else:
         raise ValueError("runner cannot walk through a wall")
 
 
-def move(runner: dict, maze: list[list[list[bool]]]) -> tuple[dict, str]:
+def move(runner: Runner, maze: list[list[list[bool]]]) -> tuple[Runner, str]:
     """Move the runner by one cell, then return the moved runner and the sequence of actions taken to get there.
 
     The runner will use a simple left-hug algorithm to move the runner. Each call of the function will advance the runner by one cell.
@@ -276,48 +389,89 @@ def move(runner: dict, maze: list[list[list[bool]]]) -> tuple[dict, str]:
 
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     maze : list[list[list[bool]]]
         The maze the runner is in.
 
     Returns
     -------
-    tuple[dict, str]
+    tuple[`Runner`, str]
         A tuple containing the moved runner and the sequence of actions taken to get there.
     """
-    walls = sense_walls(runner, maze)
-    sequence = ""
+    return _move_with_walls(runner, sense_walls(runner, maze))
 
-    if not walls[int(Wall.LEFT)]:
+
+def _move_unchecked(runner: Runner, maze: list[list[list[bool]]]) -> tuple[Runner, str]:
+    """Move the runner by one cell like `move`, without validating the position.
+
+    This is an internal helper method - not intended to be called externally.
+    The caller must ensure the runner is inside the maze, as `explore` does before its loop.
+
+    Parameters
+    ----------
+    runner : `Runner`
+        The maze runner.
+    maze : list[list[list[bool]]]
+        The maze the runner is in.
+
+    Returns
+    -------
+    tuple[`Runner`, str]
+        A tuple containing the moved runner and the sequence of actions taken to get there.
+    """
+    return _move_with_walls(runner, _sense_walls_unchecked(runner, maze))
+
+
+def _move_with_walls(
+    runner: Runner, walls: tuple[bool, bool, bool]
+) -> tuple[Runner, str]:
+    """Move the runner by one cell using the left-hug rule, given the walls around it.
+
+    This is an internal helper method - not intended to be called externally.
+
+    Parameters
+    ----------
+    runner : `Runner`
+        The maze runner.
+    walls : tuple[bool, bool, bool]
+        The walls to the left, straight ahead, and to the right of the runner, as returned by `sense_walls`.
+
+    Returns
+    -------
+    tuple[`Runner`, str]
+        A tuple containing the moved runner and the sequence of actions taken to get there.
+    """
+    x, y, orientation = runner
+
+    if not walls[_WALL_LEFT]:
         # Go left
-        sequence += "LF"
-        runner = turn(runner, Turn.LEFT)
-        runner = forward(runner)
-    elif not walls[int(Wall.FORWARD)]:
+        sequence = "LF"
+        orientation = orientation.turn_left()
+    elif not walls[_WALL_FORWARD]:
         # Go forward
-        sequence += "F"
-        runner = forward(runner)
-    elif not walls[int(Wall.RIGHT)]:
+        sequence = "F"
+    elif not walls[_WALL_RIGHT]:
         # Go right
-        sequence += "RF"
-        runner = turn(runner, Turn.RIGHT)
-        runner = forward(runner)
+        sequence = "RF"
+        orientation = orientation.turn_right()
     else:
-        # Go back
-        sequence += "B"
-        runner = backward(runner)
+        # Go back, turning around then stepping forward as `backward` does
+        return _step(x, y, orientation.turn_left().turn_left()), "B"
 
-    return runner, sequence
+    # Turn and step forward in one go, building a single new runner
+    return _step(x, y, orientation), sequence
 
 
-def in_goal(runner: dict, goal_x: int, goal_y: int) -> bool:
+def in_goal(runner: Runner, goal_x: int, goal_y: int) -> bool:
     """Return whether the runner is in the goal position.
 
+    The runner is validated with `validate_runner` in debug mode only, so the check is skipped under `python -O`.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     goal_x : int
         The x position of the goal.
     goal_y : int
@@ -328,10 +482,10 @@ def in_goal(runner: dict, goal_x: int, goal_y: int) -> bool:
     bool
         Whether the runner is in the goal position.
     """
-    x = get_x(runner)
-    y = get_y(runner)
+    if __debug__:
+        validate_runner(runner)
 
-    return (x == goal_x) and (y == goal_y)
+    return (runner.x == goal_x) and (runner.y == goal_y)
 
 
 def get_position_or_default(
@@ -371,16 +525,16 @@ def get_position_or_default(
                 f"default must be be tuple (Direction, Direction), got ({type(default[0]).__name__}, {type(default[1]).__name__})"
             )
 
-        if default[0] == Direction.WEST:
+        if default[0] is Direction.WEST:
             position_x = 0
-        elif default[0] == Direction.EAST:
+        elif default[0] is Direction.EAST:
             position_x = width - 1
         else:
             raise ValueError("default[0] must be EAST or WEST")
 
-        if default[1] == Direction.SOUTH:
+        if default[1] is Direction.SOUTH:
             position_y = 0
-        elif default[1] == Direction.NORTH:
+        elif default[1] is Direction.NORTH:
             position_y = height - 1
         else:
             raise ValueError("default[0] must be EAST or WEST")
@@ -408,14 +562,17 @@ def get_position_or_default(
 
 
 def explore(
-    runner: dict, maze: list[list[list[bool]]], goal: tuple[int, int] | None = None
+    runner: Runner, maze: list[list[list[bool]]], goal: tuple[int, int] | None = None
 ) -> list[tuple[int, int, str]]:
     """Advance the runner through the maze until the goal is reached. Return the sequence of positions and actions taken to get there.
 
+    If the runner returns to a position and orientation it has already moved on from, the walk would repeat forever,
+    so a ValueError is raised instead. The maze must be enclosed by walls on every edge, otherwise a ValueError is raised.
+
     Parameters
     ----------
-    runner : dict
-        The dictionary object representing a maze runner.
+    runner : `Runner`
+        The maze runner.
     maze : list[list[list[bool]]]
         The maze the runner is in.
     goal : tuple[int, int], optional
@@ -426,15 +583,36 @@ def explore(
     list[tuple[int, int, str]]
         The sequence of positions and actions taken to get to the goal.
     """
+    validate_runner(runner)
+    get_walls(maze, runner.x, runner.y)  # Validate the maze and starting position
+    _check_closed_boundary(maze)  # The runner's moves are not bounds checked
+
     # Get goal position
     goal_x, goal_y = get_position_or_default(
         maze, goal, (Direction.EAST, Direction.NORTH)
     )
 
     # Move runner until runner is at the goal
-    runner_action_sequence = [(runner["x"], runner["x"], "F")]
-    while not in_goal(runner, goal_x, goal_y):
-        runner, action = move(runner, maze)
-        runner_action_sequence.append((get_x(runner), get_y(runner), action))
+    x, y, _ = runner
+    runner_action_sequence = [(x, y, "F")]
+
+    # Each move depends only on the position and orientation, so seeing one again means the goal is unreachable
+    seen_states = set()
+
+    # Bind the loop's callables to locals to avoid global and attribute lookups each step
+    move_runner = _move_unchecked
+    append = runner_action_sequence.append
+    add_state = seen_states.add
+    while x != goal_x or y != goal_y:
+        state = (x, y, runner.orientation.index)
+        if state in seen_states:
+            raise ValueError(
+                f"goal ({goal_x}, {goal_y}) cannot be reached by the runner"
+            )
+        add_state(state)
+
+        runner, action = move_runner(runner, maze)
+        x, y, _ = runner
+        append((x, y, action))
 
     return runner_action_sequence
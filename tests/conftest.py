@@ -0,0 +1,35 @@
+# Copyright (c) 2025 Matty Chalk
+# Licensed under the MIT License (see LICENSE file for details)
+
+"""Shared fixtures for the testing modules."""
+
+import pytest
+from runner import create_runner
+from direction import Direction
+
+
+@pytest.fixture(scope="module")
+def south_runner():
+    """Runner at (1, 2) facing south.
+
+    Runners are immutable, so one instance can be shared by every test in a module.
+    """
+    return create_runner(1, 2, Direction.SOUTH)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless they were asked for with --benchmark-only or --benchmark-enable.
+
+    Both options come from pytest-benchmark, so without it installed the benchmarks are always skipped.
+    """
+    if config.getoption("benchmark_only", False) or config.getoption(
+        "benchmark_enable", False
+    ):
+        return
+
+    skip_benchmark = pytest.mark.skip(
+        reason="benchmarks only run with --benchmark-only or --benchmark-enable"
+    )
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_benchmark)
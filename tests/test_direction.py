@@ -3,7 +3,7 @@
 
 """Testing module for direction.py."""
 
-from direction import Direction
+from direction import Direction, turn_left_int, turn_right_int
 
 
 def test_turn_left():
@@ -22,9 +22,41 @@ def test_turn_right():
     assert Direction.WEST.turn_right() == Direction.NORTH
 
 
+def test_hash():
+    """Unit test Direction hashing."""
+    assert len({Direction.NORTH, Direction.EAST, Direction.NORTH}) == 2
+    assert {Direction.SOUTH: 1}[Direction.SOUTH] == 1
+
+    # Members equal to a string hash the same as it
+    assert Direction.WEST == "W"
+    assert hash(Direction.WEST) == hash("W")
+
+
 def test_int():
     """Unit test __int__ conversion"""
     assert int(Direction.NORTH) == 0
     assert int(Direction.EAST) == 1
     assert int(Direction.SOUTH) == 2
     assert int(Direction.WEST) == 3
+
+
+def test_index():
+    """Unit test the cached index attribute."""
+    for direction in Direction:
+        assert direction.index == int(direction)
+
+
+def test_turn_left_int():
+    """Unit test turn_left_int."""
+    assert turn_left_int(int(Direction.NORTH)) == int(Direction.WEST)
+    assert turn_left_int(int(Direction.EAST)) == int(Direction.NORTH)
+    assert turn_left_int(int(Direction.SOUTH)) == int(Direction.EAST)
+    assert turn_left_int(int(Direction.WEST)) == int(Direction.SOUTH)
+
+
+def test_turn_right_int():
+    """Unit test turn_right_int."""
+    assert turn_right_int(int(Direction.NORTH)) == int(Direction.EAST)
+    assert turn_right_int(int(Direction.EAST)) == int(Direction.SOUTH)
+    assert turn_right_int(int(Direction.SOUTH)) == int(Direction.WEST)
+    assert turn_right_int(int(Direction.WEST)) == int(Direction.NORTH)
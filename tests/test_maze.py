@@ -117,6 +117,40 @@ def test_add_vertical_wall_type_validation():
         add_vertical_wall(maze, 0, 6)
 
 
+def test_add_walls_assignment():
+    """Unit test add_walls assignment."""
+    maze = create_maze()
+
+    maze = add_walls(maze, [(2, 2)], [(2, 2)])
+    assert maze == add_vertical_wall(add_horizontal_wall(create_maze(), 2, 2), 2, 2)
+
+    maze = add_walls(maze)
+    assert maze == add_vertical_wall(add_horizontal_wall(create_maze(), 2, 2), 2, 2)
+
+
+def test_add_walls_type_validation():
+    """Unit test add_walls type validation."""
+    maze = create_maze()
+    with pytest.raises(TypeError):
+        add_walls(maze, [("Not an integer", 1)])
+    with pytest.raises(TypeError):
+        add_walls(maze, vertical_walls=[(1, "Not an integer")])
+
+    with pytest.raises(ValueError):
+        add_walls(maze, [(5, 1)])
+    with pytest.raises(ValueError):
+        add_walls(maze, [(0, 0)])
+    with pytest.raises(ValueError):
+        add_walls(maze, vertical_walls=[(-1, 1)])
+    with pytest.raises(ValueError):
+        add_walls(maze, vertical_walls=[(0, 5)])
+
+    # An invalid wall leaves the maze unchanged
+    with pytest.raises(ValueError):
+        add_walls(maze, [(2, 2), (0, 5)])
+    assert maze == create_maze()
+
+
 def test_get_dimensions_assignment():
     """Unit test get_dimensions assignment."""
     default_maze = create_maze()
@@ -3,6 +3,7 @@
 
 """Testing module for maze_runner.py."""
 
+import pytest
 from maze import *
 from maze_runner import *
 
@@ -22,7 +23,90 @@ def test_shortest_path():
         prefix.append((x, y))
 
 
-def test_maze_reader():
+def test_shortest_path_scribe(tmp_path, monkeypatch):
+    """Unit test shortest_path when scribing an exploration that passes back through the start."""
+    monkeypatch.chdir(tmp_path)
+    maze = create_maze(3, 3)
+    maze = add_horizontal_wall(maze, 0, 1)
+    maze = add_horizontal_wall(maze, 0, 2)
+    maze = add_horizontal_wall(maze, 2, 1)
+
+    # The left-hug walk is at the start cell three times before reaching the goal
+    exploration = explore(create_runner(1, 1), maze, (1, 0))
+    assert [(x, y) for x, y, _ in exploration].count((1, 1)) == 3
+
+    # Every loop through the start is removed, leaving the single step back to the goal
+    assert shortest_path(maze, (1, 1), (1, 0), scribe=True) == [(1, 1, "B")]
+
+
+def test_astar():
+    """Unit test astar."""
+    maze = create_maze(3, 3)
+    assert astar(maze, (0, 0), (0, 0)) == [(0, 0)]
+    assert astar(maze, (0, 0), (0, 2)) == [(0, 0), (0, 1), (0, 2)]
+    assert len(astar(maze)) == 5
+
+    # A wall forces a detour around it
+    maze = add_vertical_wall(maze, 0, 1)
+    maze = add_vertical_wall(maze, 1, 1)
+    assert astar(maze, (0, 0), (1, 0)) == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 2),
+        (1, 1),
+        (1, 0),
+    ]
+
+    # Goal walled off
+    maze = add_vertical_wall(maze, 2, 1)
+    with pytest.raises(ValueError):
+        astar(maze, (0, 0), (1, 0))
+
+    # Gap in the outer wall
+    maze = create_maze(3, 3)
+    maze[2][1][Direction.EAST.index] = False
+    with pytest.raises(ValueError):
+        astar(maze)
+
+
+def test_is_valid_maze_file(tmp_path):
+    """Unit test is_valid_maze_file."""
+    maze_files = {
+        "valid": "#####\n#...#\n#.#.#\n#...#\n#####\n",
+        "open_top": "##.##\n#...#\n#####\n",
+        "open_side": "#####\n....#\n#####\n",
+        "missing_intersection": "#####\n#...#\n#...#\n#...#\n#####\n",
+        "wall_in_cell": "#####\n#..##\n#####\n",
+        "jagged": "#####\n#...#\n###\n",
+        "even": "####\n#..#\n####\n",
+    }
+    for name, contents in maze_files.items():
+        (tmp_path / f"{name}.mz").write_text(contents)
+
+    assert is_valid_maze_file(str(tmp_path / "valid.mz"))
+    assert is_valid_maze_file("src/medium_maze.mz")
+    for name in maze_files.keys() - {"valid"}:
+        assert not is_valid_maze_file(str(tmp_path / f"{name}.mz")), name
+
+
+def test_maze_file_cell_to_maze_cell():
+    """Unit test maze_file_cell_to_maze_cell."""
+    assert maze_file_cell_to_maze_cell(("#", ".", "#", ".")) == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert maze_file_cell_to_maze_cell((".", "#", ".", "#")) == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_maze_reader(tmp_path):
     """Unit test maze_reader."""
     tiny_maze = maze_reader("src/tiny_maze.mz")
     assert get_dimensions(tiny_maze) == (1, 1)
@@ -59,3 +143,9 @@ def test_maze_reader():
     assert get_walls(medium_maze, 0, 2) == (True, False, False, True)
     assert get_walls(medium_maze, 1, 2) == (True, True, True, False)
     assert get_walls(medium_maze, 2, 2) == (True, True, False, True)
+
+    # Files with no cells pass the character checks but describe an empty maze
+    for name, contents in {"no_width": "#\n#\n#\n", "no_cells": "#\n"}.items():
+        (tmp_path / f"{name}.mz").write_text(contents)
+        with pytest.raises(ValueError):
+            maze_reader(str(tmp_path / f"{name}.mz"))
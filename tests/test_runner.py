@@ -4,140 +4,177 @@
 """Testing module for runner.py."""
 
 import pytest
-from runner import *
+from runner import (
+    Runner,
+    create_runner,
+    validate_runner,
+    get_x,
+    get_y,
+    get_orientation,
+    turn,
+    forward,
+    forward_many,
+    backward,
+    sense_walls,
+    go_straight,
+    move,
+    in_goal,
+    get_position_or_default,
+    explore,
+)
+from maze import create_maze, add_horizontal_wall, add_vertical_wall
 from direction import Direction
 from turn import Turn
 
 
 def test_create_runner_assignment():
     """Unit test create_runner assignment."""
-    assert create_runner() == {"x": 0, "y": 0, "orientation": Direction.NORTH}
-    assert create_runner(x=1, y=1, orientation=Direction.EAST) == {
-        "x": 1,
-        "y": 1,
-        "orientation": Direction.EAST,
-    }
-    assert create_runner(5, 7, Direction.WEST) == {
-        "x": 5,
-        "y": 7,
-        "orientation": Direction.WEST,
-    }
-
-
-def test_create_runner_type_validation():
+    assert create_runner() == Runner(0, 0, Direction.NORTH)
+    assert create_runner(x=1, y=1, orientation=Direction.EAST) == Runner(
+        1, 1, Direction.EAST
+    )
+    assert create_runner(5, 7, Direction.WEST) == Runner(5, 7, Direction.WEST)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"x": "Not an integer"},
+        {"y": "Not an integer"},
+        {"orientation": "Not a Direction enum"},
+    ],
+)
+def test_create_runner_type_validation(kwargs):
     """Unit test create_runner type validation."""
     with pytest.raises(TypeError):
-        create_runner(x="Not an integer")
-    with pytest.raises(TypeError):
-        create_runner(y="Not an integer")
-    with pytest.raises(TypeError):
-        create_runner(orientation="Not a Direction enum")
+        create_runner(**kwargs)
 
 
-def test_get_x():
-    """Unit test get_x."""
-    runner = create_runner(1, 2, Direction.SOUTH)
-    assert get_x(runner) == 1
-
+def test_validate_runner(south_runner):
+    """Unit test validate_runner."""
+    validate_runner(south_runner)
 
-def test_get_x_type_validation():
-    """Unit test get_x type validation."""
-    runner = "Not a dict"
     with pytest.raises(TypeError):
-        get_x(runner)
-
-    runner = {"A": "Missing x key"}
-    with pytest.raises(KeyError):
-        get_x(runner)
-
-    runner = create_runner(1, 2, Direction.SOUTH)
-    runner["x"] = "Not an integer"
+        validate_runner({"x": 1, "y": 2, "orientation": Direction.SOUTH})
     with pytest.raises(TypeError):
-        get_x(runner)
-
-
-def test_get_y():
-    """Unit test get_y."""
-    runner = create_runner(1, 2, Direction.SOUTH)
-    assert get_y(runner) == 2
-
-
-def test_get_y_type_validation():
-    """Unit test get_y type validation."""
-    runner = "Not a dict"
+        validate_runner(south_runner._replace(x="Not an integer"))
     with pytest.raises(TypeError):
-        get_y(runner)
-
-    runner = {"A": "Missing y key"}
-    with pytest.raises(KeyError):
-        get_y(runner)
-
-    runner = create_runner(1, 2, Direction.SOUTH)
-    runner["y"] = "Not an integer"
+        validate_runner(south_runner._replace(y="Not an integer"))
     with pytest.raises(TypeError):
-        get_y(runner)
+        validate_runner(south_runner._replace(orientation="Not a Direction enum"))
 
 
-def test_get_orientation():
-    """Unit test get_orientation."""
-    runner = create_runner(1, 2, Direction.SOUTH)
-    assert get_orientation(runner) == Direction.SOUTH
+def test_get_x(south_runner):
+    """Unit test get_x."""
+    assert get_x(south_runner) == 1
 
 
-def test_get_orientation_type_validation():
-    """Unit test get_orientation type validation."""
-    runner = "Not a dict"
-    with pytest.raises(TypeError):
-        get_orientation(runner)
+def test_get_y(south_runner):
+    """Unit test get_y."""
+    assert get_y(south_runner) == 2
 
-    runner = {"A": "Missing orientation key"}
-    with pytest.raises(KeyError):
-        get_orientation(runner)
 
-    runner = create_runner(1, 2, Direction.SOUTH)
-    runner["orientation"] = "Not a Direction enum"
+def test_get_orientation(south_runner):
+    """Unit test get_orientation."""
+    assert get_orientation(south_runner) == Direction.SOUTH
+
+
+@pytest.mark.skipif(not __debug__, reason="getter type checks are skipped under -O")
+@pytest.mark.parametrize(
+    "getter, runner",
+    [
+        (get_x, "Not a Runner"),
+        (get_x, {"x": 1}),
+        (get_x, Runner("Not an integer", 2, Direction.SOUTH)),
+        (get_y, "Not a Runner"),
+        (get_y, {"y": 2}),
+        (get_y, Runner(1, "Not an integer", Direction.SOUTH)),
+        (get_orientation, "Not a Runner"),
+        (get_orientation, {"orientation": Direction.SOUTH}),
+        (get_orientation, Runner(1, 2, "Not a Direction enum")),
+    ],
+)
+def test_getters_type_validation(getter, runner):
+    """Unit test get_x, get_y and get_orientation type validation."""
     with pytest.raises(TypeError):
-        get_orientation(runner)
+        getter(runner)
 
 
-def test_turn():
+def test_turn(south_runner):
     """Unit test turn."""
-    runner = create_runner(1, 2, Direction.SOUTH)
-    assert turn(runner, Turn.RIGHT)["orientation"] == Direction.WEST
-    assert turn(runner, Turn.LEFT)["orientation"] == Direction.EAST
+    assert turn(south_runner, Turn.RIGHT).orientation == Direction.WEST
+    assert turn(south_runner, Turn.LEFT).orientation == Direction.EAST
+
+    # Wrap around between WEST and NORTH
+    assert turn(create_runner(), Turn.LEFT).orientation == Direction.WEST
+    assert turn(create_runner(0, 0, Direction.WEST), Turn.RIGHT).orientation == (
+        Direction.NORTH
+    )
 
 
-def test_turn_type_validation():
+def test_turn_type_validation(south_runner):
     """Unit test turn type validation."""
-    runner = create_runner(1, 2, Direction.SOUTH)
     with pytest.raises(TypeError):
-        turn(runner, "Not a Turn enum")
-
-
-def test_forward():
+        turn(south_runner, "Not a Turn enum")
+
+
+@pytest.mark.parametrize(
+    "orientation, expected",
+    [
+        (Direction.NORTH, Runner(0, 1, Direction.NORTH)),
+        (Direction.EAST, Runner(1, 0, Direction.EAST)),
+        (Direction.SOUTH, Runner(0, -1, Direction.SOUTH)),
+        (Direction.WEST, Runner(-1, 0, Direction.WEST)),
+    ],
+)
+def test_forward(orientation, expected):
     """Unit test forward."""
-    runner_north = create_runner(0, 0, Direction.NORTH)
-    runner_east = create_runner(0, 0, Direction.EAST)
-    runner_south = create_runner(0, 0, Direction.SOUTH)
-    runner_west = create_runner(0, 0, Direction.WEST)
+    assert forward(create_runner(0, 0, orientation)) == expected
 
-    assert forward(runner_north) == {"x": 0, "y": 1, "orientation": Direction.NORTH}
-    assert forward(runner_east) == {"x": 1, "y": 0, "orientation": Direction.EAST}
-    assert forward(runner_south) == {"x": 0, "y": -1, "orientation": Direction.SOUTH}
-    assert forward(runner_west) == {"x": -1, "y": 0, "orientation": Direction.WEST}
 
+def test_forward_many():
+    """Unit test forward_many."""
+    runners = [
+        create_runner(i, -i, direction) for i in range(250) for direction in Direction
+    ]
 
-def test_backward():
+    moved = forward_many(runners)
+    assert moved == [forward(runner) for runner in runners]
+    assert all(type(runner) is Runner for runner in moved)
+    assert forward_many([]) == []
+
+    if __debug__:  # Runner checks are skipped under -O
+        with pytest.raises(TypeError):
+            forward_many([create_runner(), {"x": 0, "y": 0}])
+
+
+@pytest.mark.parametrize(
+    "orientation, expected",
+    [
+        (Direction.NORTH, Runner(0, -1, Direction.SOUTH)),
+        (Direction.EAST, Runner(-1, 0, Direction.WEST)),
+        (Direction.SOUTH, Runner(0, 1, Direction.NORTH)),
+        (Direction.WEST, Runner(1, 0, Direction.EAST)),
+    ],
+)
+def test_backward(orientation, expected):
     """Unit test backward."""
-    runner_north = create_runner(0, 0, Direction.NORTH)
-    runner_east = create_runner(0, 0, Direction.EAST)
-    runner_south = create_runner(0, 0, Direction.SOUTH)
-    runner_west = create_runner(0, 0, Direction.WEST)
-
-    assert backward(runner_north) == {"x": 0, "y": -1, "orientation": Direction.SOUTH}
-    assert backward(runner_east) == {"x": -1, "y": 0, "orientation": Direction.WEST}
-    assert backward(runner_south) == {"x": 0, "y": 1, "orientation": Direction.NORTH}
-    assert backward(runner_west) == {"x": 1, "y": 0, "orientation": Direction.EAST}
+    assert backward(create_runner(0, 0, orientation)) == expected
+
+
+@pytest.mark.skipif(not __debug__, reason="runner checks are skipped under -O")
+@pytest.mark.parametrize(
+    "function, arguments",
+    [
+        (forward, ()),
+        (backward, ()),
+        (in_goal, (0, 0)),
+    ],
+)
+def test_movement_type_validation(function, arguments):
+    """Unit test forward, backward and in_goal type validation."""
+    with pytest.raises(TypeError):
+        function({"x": 0, "y": 0, "orientation": Direction.NORTH}, *arguments)
 
 
 def test_sense_walls():
@@ -167,7 +204,27 @@ def test_go_straight():
         go_straight(runner, maze)
 
     runner = turn(runner, Turn.RIGHT)
-    assert go_straight(runner, maze) == {"x": 2, "y": 1, "orientation": Direction.EAST}
+    assert go_straight(runner, maze) == Runner(2, 1, Direction.EAST)
+
+
+def test_move():
+    """Unit test move."""
+    maze = create_maze(3, 3)
+
+    assert move(create_runner(0, 0, Direction.NORTH), maze) == (
+        Runner(0, 1, Direction.NORTH),
+        "F",
+    )
+    assert move(create_runner(1, 1, Direction.NORTH), maze) == (
+        Runner(0, 1, Direction.WEST),
+        "LF",
+    )
+
+    # Runner outside the maze
+    with pytest.raises(ValueError):
+        move(create_runner(-1, 0, Direction.NORTH), maze)
+    with pytest.raises(ValueError):
+        move(create_runner(5, 5, Direction.NORTH), maze)
 
 
 def test_get_position_or_default():
@@ -226,3 +283,26 @@ def test_explore():
         (0, 2, "F"),
         (1, 2, "RF"),
     ]
+
+    # Goal walled off from the runner
+    for y in range(3):
+        maze = add_vertical_wall(maze, y, 2)
+    with pytest.raises(ValueError):
+        explore(runner, maze, (2, 2))
+
+
+def test_explore_open_boundary():
+    """Unit test explore on a maze with a gap in its outer wall."""
+    maze = create_maze(3, 3)
+    maze[0][1][Direction.WEST.index] = False
+
+    with pytest.raises(ValueError):
+        explore(create_runner(0, 0), maze, (2, 2))
+
+
+def test_explore_start_position():
+    """Unit test that explore records the starting position as (x, y) when x != y."""
+    maze = create_maze(3, 3)
+
+    assert explore(create_runner(2, 0), maze, (2, 0)) == [(2, 0, "F")]
+    assert explore(create_runner(0, 1), maze, (0, 2)) == [(0, 1, "F"), (0, 2, "F")]
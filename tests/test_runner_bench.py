@@ -0,0 +1,46 @@
+# Copyright (c) 2025 Matty Chalk
+# Licensed under the MIT License (see LICENSE file for details)
+
+"""Benchmarking module for runner.py.
+
+Requires pytest-benchmark. These are skipped in normal test runs (see conftest.py);
+run `pytest tests --benchmark-only` to time them without the unit tests, or add `--benchmark-enable` to run both.
+"""
+
+import pytest
+from runner import create_runner, forward, get_x, turn
+from direction import Direction
+from turn import Turn
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def runner():
+    """Runner at the origin facing north."""
+    return create_runner(0, 0, Direction.NORTH)
+
+
+def test_forward_bench(benchmark, runner):
+    """Benchmark forward."""
+    benchmark.pedantic(
+        forward, args=(runner,), iterations=10_000, rounds=50, warmup_rounds=2
+    )
+
+
+def test_turn_bench(benchmark, runner):
+    """Benchmark turn."""
+    benchmark.pedantic(
+        turn,
+        args=(runner, Turn.RIGHT),
+        iterations=10_000,
+        rounds=50,
+        warmup_rounds=2,
+    )
+
+
+def test_get_x_bench(benchmark, runner):
+    """Benchmark get_x."""
+    benchmark.pedantic(
+        get_x, args=(runner,), iterations=10_000, rounds=50, warmup_rounds=2
+    )